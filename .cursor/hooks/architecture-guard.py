@@ -34,52 +34,84 @@ import sys
 # Matches:  import ... from '...'  /  import ... from "..."
 # Also handles:  import '...'  (side-effect imports)
 # Also handles:  export ... from '...'
+#
+# Anchored to the start of a line and the bindings are a negated class
+# rather than `.*?` — the old unanchored `.*?\s+from\s+` form backtracked
+# cubically on long whitespace runs after `import`.
 IMPORT_RE = re.compile(
-    r"""(?:import|export)\s+"""          # import or export keyword
-    r"""(?:.*?\s+from\s+)?"""            # optional default/named bindings
-    r"""['"]([^'"]+)['"]""",             # the module specifier (group 1)
+    r"""^[ \t]*(?:import|export)\b"""    # import or export keyword
+    r"""(?:[^'"\n;]*?\sfrom)?\s*"""      # optional default/named bindings
+    r"""['"]([^'"\n]+)['"]""",           # the module specifier (group 1)
     re.MULTILINE,
 )
 
 # Dynamic imports:  import('...')  /  await import('...')
 DYNAMIC_IMPORT_RE = re.compile(
-    r"""import\s*\(\s*['"]([^'"]+)['"]\s*\)""",
+    r"""import\s*\(\s*['"]([^'"\n]+)['"]\s*\)""",
     re.MULTILINE,
 )
 
 # require():  require('...')
 REQUIRE_RE = re.compile(
-    r"""require\s*\(\s*['"]([^'"]+)['"]\s*\)""",
+    r"""require\s*\(\s*['"]([^'"\n]+)['"]\s*\)""",
     re.MULTILINE,
 )
 
+# All three forms as one alternation so the source is scanned once.  Each
+# branch has exactly one capture group, so ``lastindex`` names the match.
+IMPORT_SPECIFIER_RE = re.compile(
+    "|".join(p.pattern for p in (IMPORT_RE, DYNAMIC_IMPORT_RE, REQUIRE_RE)),
+    re.MULTILINE,
+)
+
+# File-path filters used on every modified file.
+_TS_EXT_RE = re.compile(r"\.(tsx?|jsx?)$")
+_FEATURE_DIR_RE = re.compile(r"src/features/([^/]+)")
+
 
 def parse_imports(source: str) -> list[str]:
     """Extract every import/require specifier from TypeScript/JavaScript source."""
-    specifiers: list[str] = []
-    for pattern in (IMPORT_RE, DYNAMIC_IMPORT_RE, REQUIRE_RE):
-        specifiers.extend(pattern.findall(source))
-    return specifiers
+    # Cheap substring probe: files with no module syntax skip the regex.
+    if "import" not in source and "export" not in source and "require" not in source:
+        return []
+    return [m.group(m.lastindex) for m in IMPORT_SPECIFIER_RE.finditer(source)]
 
 
 def normalize_path(p: str) -> str:
     """Forward-slash normalised, lowercase drive letter."""
-    return p.replace("\\", "/")
+    return p.replace("\\", "/") if "\\" in p else p
 
 
 def extract_feature_name(file_path: str) -> str | None:
     """Return the feature folder name if *file_path* is inside src/features/<name>/."""
-    match = re.search(r"src/features/([^/]+)", file_path)
+    match = _FEATURE_DIR_RE.search(file_path)
     return match.group(1) if match else None
 
 
-def is_shared_type_import(specifier: str) -> bool:
-    """True when the import points at a /types/ barrel or a types file."""
-    norm = normalize_path(specifier)
+def is_shared_type_import(norm: str) -> bool:
+    """True when the (normalised) import points at a /types/ barrel or a types file."""
     # @/features/equipment/types  or  @/features/equipment/types/equipment
-    if "/types" in norm:
-        return True
-    return False
+    return "/types" in norm
+
+
+_FEATURES_ALIAS = "@/features/"
+_FEATURES_SRC = "src/features/"
+
+
+def _segment_at(norm: str, start: int) -> str:
+    """Return the path segment of *norm* beginning at *start*, without splitting."""
+    end = norm.find("/", start)
+    return norm[start:end] if end != -1 else norm[start:]
+
+
+def target_feature_name(norm: str) -> str | None:
+    """Return the feature an (already normalised) import specifier points at."""
+    if norm.startswith(_FEATURES_ALIAS):
+        return _segment_at(norm, len(_FEATURES_ALIAS)) or None
+    idx = norm.find(_FEATURES_SRC)
+    if idx != -1:
+        return _segment_at(norm, idx + len(_FEATURES_SRC)) or None
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -87,12 +119,11 @@ def is_shared_type_import(specifier: str) -> bool:
 # ---------------------------------------------------------------------------
 
 def check_ui_purity(file_path: str, imports: list[str]) -> dict | None:
-    """Rule 1: src/components/ui files must not import from @/features."""
-    violating: list[str] = []
-    for spec in imports:
-        norm = normalize_path(spec)
-        if norm.startswith("@/features") or norm.startswith("@/features/"):
-            violating.append(spec)
+    """Rule 1: src/components/ui files must not import from @/features.
+
+    *imports* must already be normalised with normalize_path().
+    """
+    violating = [spec for spec in imports if spec.startswith("@/features")]
 
     if not violating:
         return None
@@ -109,23 +140,18 @@ def check_ui_purity(file_path: str, imports: list[str]) -> dict | None:
 
 
 def check_feature_isolation(file_path: str, imports: list[str]) -> dict | None:
-    """Rule 2: src/features/A must not import from src/features/B (warn only)."""
+    """Rule 2: src/features/A must not import from src/features/B (warn only).
+
+    *imports* must already be normalised with normalize_path().
+    """
     own_feature = extract_feature_name(file_path)
     if not own_feature:
         return None
 
     cross_imports: list[dict] = []
     for spec in imports:
-        norm = normalize_path(spec)
-
         # Check both alias and relative paths
-        other_feature: str | None = None
-        if norm.startswith("@/features/"):
-            other_feature = norm.split("/")[2] if len(norm.split("/")) > 2 else None
-        elif "src/features/" in norm:
-            parts = norm.split("src/features/")
-            if len(parts) > 1:
-                other_feature = parts[1].split("/")[0] if parts[1] else None
+        other_feature = target_feature_name(spec)
 
         if other_feature and other_feature != own_feature:
             if is_shared_type_import(spec):
@@ -171,10 +197,41 @@ def read_file_source(file_path: str, project_root: str) -> str | None:
         return None
 
 
+# Below this many files the thread-pool start-up costs more than it saves.
+PARALLEL_READ_MIN_FILES = 4
+PARALLEL_READ_WORKERS = 8
+
+
+def read_file_sources(file_paths: list[str], project_root: str) -> list[str | None]:
+    """read_file_source() for each path, overlapping the IO for larger batches."""
+    if len(file_paths) < PARALLEL_READ_MIN_FILES:
+        return [read_file_source(p, project_root) for p in file_paths]
+    # Deferred: concurrent.futures is slow to import and most calls never
+    # reach this branch.
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(PARALLEL_READ_WORKERS, len(file_paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda p: read_file_source(p, project_root), file_paths))
+
+
 # ---------------------------------------------------------------------------
 # Resolve modified files from hook input
 # ---------------------------------------------------------------------------
 
+# Hook payloads are small JSON documents; anything larger is not buffered
+# or parsed — the hook fails open instead.
+MAX_STDIN_BYTES = 4 * 1024 * 1024
+
+
+def read_stdin() -> str | None:
+    """Read the hook payload, or None if it exceeds MAX_STDIN_BYTES."""
+    raw = sys.stdin.buffer.read(MAX_STDIN_BYTES)
+    if len(raw) == MAX_STDIN_BYTES and sys.stdin.buffer.read(1):
+        return None
+    return raw.decode("utf-8", errors="replace")
+
+
 def get_modified_files(data: dict) -> list[str]:
     """
     Extract file paths from the hook input regardless of event type.
@@ -195,7 +252,8 @@ def get_modified_files(data: dict) -> list[str]:
             if isinstance(f, str) and f:
                 files.append(f)
 
-    return files
+    # path is often repeated in files; keep first-seen order
+    return list(dict.fromkeys(files))
 
 
 # ---------------------------------------------------------------------------
@@ -204,8 +262,11 @@ def get_modified_files(data: dict) -> list[str]:
 
 def main() -> None:
     # ---- parse stdin --------------------------------------------------------
+    raw = read_stdin()
+    if raw is None:
+        _allow()
+        return
     try:
-        raw = sys.stdin.read()
         data: dict = json.loads(raw) if raw.strip() else {}
     except (json.JSONDecodeError, TypeError):
         _allow()
@@ -221,15 +282,26 @@ def main() -> None:
         _allow()
         return
 
-    # ---- run checks ---------------------------------------------------------
-    violations: list[dict] = []   # UI Purity – hard block
-    warnings: list[dict] = []     # Feature Isolation – soft warn
+    # Nothing under either guarded tree (the common case) → done
+    if not any(
+        "src/components/ui/" in norm or "src/features/" in norm
+        for norm in map(normalize_path, modified_files)
+    ):
+        _allow()
+        return
 
+    # ---- select candidate files ---------------------------------------------
+    # (file_path, norm_path, is_ui_file, is_feature_file)
+    candidates: list[tuple[str, str, bool, bool]] = []
+    seen: set[str] = set()
     for file_path in modified_files:
         norm_path = normalize_path(file_path)
+        if norm_path in seen:
+            continue  # same file spelled with different separators
+        seen.add(norm_path)
 
         # Only check TS/TSX/JS/JSX files
-        if not re.search(r"\.(tsx?|jsx?)$", norm_path):
+        if not _TS_EXT_RE.search(norm_path):
             continue
 
         is_ui_file = "src/components/ui/" in norm_path
@@ -238,11 +310,21 @@ def main() -> None:
         if not is_ui_file and not is_feature_file:
             continue
 
-        source = read_file_source(file_path, project_root)
+        candidates.append((file_path, norm_path, is_ui_file, is_feature_file))
+
+    # ---- read sources (IO-bound; concurrent for larger batches) -------------
+    sources = read_file_sources([c[0] for c in candidates], project_root)
+
+    # ---- run checks ---------------------------------------------------------
+    violations: list[dict] = []   # UI Purity – hard block
+    warnings: list[dict] = []     # Feature Isolation – soft warn
+
+    for (_, norm_path, is_ui_file, is_feature_file), source in zip(candidates, sources):
         if source is None:
             continue
 
-        imports = parse_imports(source)
+        # Normalise once here rather than in every rule check
+        imports = [normalize_path(spec) for spec in parse_imports(source)]
 
         # Rule 1: UI Purity (block)
         if is_ui_file:
@@ -270,8 +352,7 @@ def main() -> None:
             "user_message": violations[0]["message"],
             "agent_message": json.dumps(error_payload),
         }
-        print(json.dumps(response))
-        sys.exit(0)
+        _respond(response)
 
     # Soft warnings → allow but warn
     if warnings:
@@ -285,16 +366,27 @@ def main() -> None:
             "user_message": warnings[0]["message"],
             "agent_message": json.dumps(warn_payload),
         }
-        print(json.dumps(response))
-        sys.exit(0)
+        _respond(response)
 
     # No issues
     _allow()
 
 
+# The default response never changes – emit pre-encoded bytes instead of
+# running the JSON encoder on the most common path.
+_ALLOW_BYTES = b'{"continue": true}\n'
+
+
 def _allow() -> None:
     """Emit the default 'continue' response and exit."""
-    print(json.dumps({"continue": True}))
+    sys.stdout.buffer.write(_ALLOW_BYTES)
+    sys.exit(0)
+
+
+def _respond(response: dict) -> None:
+    """Emit *response* as one JSON line (single write + flush) and exit."""
+    sys.stdout.write(json.dumps(response) + "\n")
+    sys.stdout.flush()
     sys.exit(0)
 
 
@@ -10,11 +10,12 @@ Stdin:  JSON  {"path": "<file-path>"}
 Stdout: JSON  {"continue": true, ...}  (with optional user_message / agent_message)
 """
 
+import heapq
 import json
 import os
 import re
 import sys
-from difflib import SequenceMatcher
+from collections.abc import Iterator
 
 # ---------------------------------------------------------------------------
 # Semantic synonym groups – components that serve the same UI purpose
@@ -136,9 +137,36 @@ SEMANTIC_GROUPS: dict[str, list[str]] = {
     ],
 }
 
+# Flattened (keyword, group) pairs so group lookup is a single pass rather
+# than a loop over groups and then keywords.
+_KEYWORD_GROUPS: tuple[tuple[str, str], ...] = tuple(
+    (kw, group) for group, keywords in SEMANTIC_GROUPS.items() for kw in keywords
+)
+
 # Match threshold – lower = more aggressive warnings
 FUZZY_THRESHOLD = 0.55
 
+# Filename patterns, compiled once rather than per call
+_TEST_SPEC_RE = re.compile(r"\.(test|spec)\.")
+_COMPONENT_EXT_RE = re.compile(r"\.(tsx?|jsx?|vue|svelte)$")
+_HOOK_PREFIX_RE = re.compile(r"^(use[-_]?|with[-_]?)")
+_SEPARATOR_RE = re.compile(r"[-_.]")
+
+# Hook payloads are small JSON documents; anything larger is not buffered
+# or parsed — the hook fails open instead.
+MAX_STDIN_BYTES = 4 * 1024 * 1024
+
+# Directory walk filters – plain string checks on each scandir entry
+_SKIP_DIRS = frozenset(("__tests__", "node_modules", ".git", "dist", "build"))
+_COMPONENT_EXTS = (".tsx", ".ts", ".jsx", ".js")
+
+# Component scan cache – reused across hook invocations until any directory
+# under src/components changes (adding, removing or renaming an entry bumps
+# its parent directory's mtime).  Kept in the per-user cache directory, one
+# file per checkout, so other local users cannot plant entries in it.
+_CACHE_DIR_NAME = "equipqr-hooks"
+_CACHE_VERSION = 3
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -146,55 +174,193 @@ FUZZY_THRESHOLD = 0.55
 
 def normalize_name(filename: str) -> str:
     """Lowercase, strip extension, remove hyphens/underscores."""
-    name = re.sub(r"\.(tsx?|jsx?|vue|svelte)$", "", filename)
+    name = _COMPONENT_EXT_RE.sub("", filename)
     name = name.lower()
     # Drop common hook / HOC prefixes so "useDialog" matches "dialog"
-    name = re.sub(r"^(use[-_]?|with[-_]?)", "", name)
+    name = _HOOK_PREFIX_RE.sub("", name)
     # Collapse separators
-    name = re.sub(r"[-_.]", "", name)
+    name = _SEPARATOR_RE.sub("", name)
     return name
 
 
 def get_semantic_groups(normalized: str) -> set[str]:
     """Return every semantic-group tag that overlaps with *normalized*."""
-    groups: set[str] = set()
-    for group, keywords in SEMANTIC_GROUPS.items():
-        for kw in keywords:
-            if kw in normalized or normalized in kw:
-                groups.add(group)
-    return groups
+    return {
+        group
+        for kw, group in _KEYWORD_GROUPS
+        if kw in normalized or normalized in kw
+    }
 
 
-def collect_components(components_dir: str) -> list[dict]:
-    """Walk src/components and return metadata for every component file."""
+def _iter_component_files(
+    path: str,
+    rel: str,
+    dir_mtimes: dict[str, int],
+) -> Iterator[tuple[str, str]]:
+    """Yield (filename, rel_path) for every component file below *path*.
+
+    Uses os.scandir so directory checks come from the entry's d_type hint
+    instead of a stat per entry.  Each visited directory's mtime is recorded
+    in *dir_mtimes* for cache invalidation.  Files are yielded before
+    descending, matching os.walk's top-down order.
+    """
+    try:
+        dir_mtimes[rel.rstrip("/") or "."] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs: list[os.DirEntry] = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            # Skip test / build artefact dirs
+            if name not in _SKIP_DIRS:
+                subdirs.append(entry)
+        elif (
+            name.endswith(_COMPONENT_EXTS)
+            and ".test." not in name
+            and ".spec." not in name
+        ):
+            yield name, rel + name
+
+    for entry in subdirs:
+        yield from _iter_component_files(entry.path, f"{rel}{entry.name}/", dir_mtimes)
+
+
+def _walk_components(components_dir: str) -> tuple[list[dict], dict[str, int]]:
+    """Walk src/components; return component metadata and per-directory mtimes."""
     components: list[dict] = []
+    dir_mtimes: dict[str, int] = {}
+
+    for fname, rel_path in _iter_component_files(components_dir, "", dir_mtimes):
+        normalized = normalize_name(fname)
+        components.append(
+            {
+                "name": fname,
+                "rel_path": rel_path,
+                "normalized": normalized,
+                # Computed once here (and cached) rather than per query
+                "groups": sorted(get_semantic_groups(normalized)),
+                "bigrams": sorted(bigrams(normalized)),
+            }
+        )
+    return components, dir_mtimes
+
+
+def _dirs_unchanged(components_dir: str, dir_mtimes: dict[str, int]) -> bool:
+    """True when every cached directory still exists with the same mtime."""
+    for rel, mtime in dir_mtimes.items():
+        try:
+            if os.stat(os.path.join(components_dir, rel)).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _cache_path(components_dir: str) -> str | None:
+    """Per-user cache file for *components_dir*, or None if there is no home."""
+    # Resolved lazily – only the fuzzy-search path ever needs it.
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        home = os.path.expanduser("~")
+        if home == "~":
+            return None
+        base = os.path.join(home, ".cache")
+    import zlib
+
+    checkout = zlib.crc32(components_dir.encode("utf-8", "surrogatepass"))
+    return os.path.join(base, _CACHE_DIR_NAME, f"components-{checkout:08x}.json")
+
+
+def _hook_fingerprint() -> int:
+    """mtime of this file – cached groups go stale when SEMANTIC_GROUPS is edited."""
+    try:
+        return os.stat(__file__).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_cache(cache_path: str, components_dir: str) -> list[dict] | None:
+    """Return cached components for *components_dir*, or None if stale/missing."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+        dirs = cache["dirs"]
+        if (
+            cache.get("version") == _CACHE_VERSION
+            and cache.get("hook") == _hook_fingerprint()
+            and cache.get("root") == components_dir
+            # The walk always records the root; without it nothing is checked
+            and "." in dirs
+            and _dirs_unchanged(components_dir, dirs)
+        ):
+            return cache["components"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def _save_cache(
+    cache_path: str,
+    components_dir: str,
+    components: list[dict],
+    dir_mtimes: dict[str, int],
+) -> None:
+    """Best-effort atomic write of the component cache."""
+    payload = {
+        "version": _CACHE_VERSION,
+        "hook": _hook_fingerprint(),
+        "root": components_dir,
+        "dirs": dir_mtimes,
+        "components": components,
+    }
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def collect_components(components_dir: str) -> list[dict]:
+    """Return metadata for every component file under src/components (cached)."""
     if not os.path.isdir(components_dir):
-        return components
+        return []
 
-    for root, dirs, files in os.walk(components_dir):
-        # Skip test / build artefact dirs
-        dirs[:] = [
-            d for d in dirs
-            if d not in ("__tests__", "node_modules", ".git", "dist", "build")
-        ]
-        for fname in files:
-            if not re.search(r"\.(tsx?|jsx?)$", fname):
-                continue
-            if re.search(r"\.(test|spec)\.", fname):
-                continue
-            rel = os.path.relpath(os.path.join(root, fname), components_dir)
-            components.append(
-                {
-                    "name": fname,
-                    "rel_path": rel.replace("\\", "/"),
-                    "normalized": normalize_name(fname),
-                }
-            )
+    cache_path = _cache_path(components_dir)
+    if cache_path is None:
+        return _walk_components(components_dir)[0]
+
+    cached = _load_cache(cache_path, components_dir)
+    if cached is not None:
+        return cached
+
+    components, dir_mtimes = _walk_components(components_dir)
+    _save_cache(cache_path, components_dir, components, dir_mtimes)
     return components
 
 
-def fuzzy_score(a: str, b: str) -> float:
-    return SequenceMatcher(None, a, b).ratio()
+def bigrams(s: str) -> frozenset[str]:
+    """Character bigrams of *s* (the string itself when shorter than two chars)."""
+    if len(s) < 2:
+        return frozenset((s,)) if s else frozenset()
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1))
+
+
+def fuzzy_score(a: frozenset[str], b: frozenset[str]) -> float:
+    """Dice coefficient of two bigram sets – O(n+m), on the same 0..1 scale
+    as SequenceMatcher.ratio() so FUZZY_THRESHOLD keeps its meaning."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
 
 
 def find_similar(
@@ -204,35 +370,59 @@ def find_similar(
 ) -> list[dict]:
     """Return up to 5 existing components ranked by similarity to *target*."""
     target_norm = normalize_name(target)
+
+    # Same normalised name already taken (e.g. Button.tsx vs button.tsx) –
+    # report those outright and skip the fuzzy / semantic pass.
+    exact = [comp for comp in existing if comp["normalized"] == target_norm]
+    if exact:
+        return [
+            {
+                "name": comp["name"],
+                "path": comp["rel_path"],
+                "score": 1.0,
+                "groups": list(comp["groups"]),
+            }
+            for comp in exact[:5]
+        ]
+
     target_groups = get_semantic_groups(target_norm)
+    target_bigrams = bigrams(target_norm)
+
+    def hits() -> Iterator[tuple[float, dict, set[str]]]:
+        for comp in existing:
+            score = fuzzy_score(target_bigrams, frozenset(comp["bigrams"]))
 
-    scored: list[dict] = []
-    for comp in existing:
-        score = fuzzy_score(target_norm, comp["normalized"])
+            # Semantic-group boost (component groups are precomputed at scan time)
+            overlap = target_groups.intersection(comp["groups"]) if target_groups else set()
+            if overlap:
+                score = max(score, 0.60)
+                score += 0.15 * len(overlap)
 
-        # Semantic-group boost
-        comp_groups = get_semantic_groups(comp["normalized"])
-        overlap = target_groups & comp_groups
-        if overlap:
-            score = max(score, 0.60)
-            score += 0.15 * len(overlap)
+            # Substring containment boost
+            if target_norm in comp["normalized"] or comp["normalized"] in target_norm:
+                score = max(score, 0.70)
 
-        # Substring containment boost
-        if target_norm in comp["normalized"] or comp["normalized"] in target_norm:
-            score = max(score, 0.70)
+            if score >= threshold:
+                yield round(min(score, 1.0), 2), comp, overlap
 
-        if score >= threshold:
-            scored.append(
-                {
-                    "name": comp["name"],
-                    "path": comp["rel_path"],
-                    "score": round(min(score, 1.0), 2),
-                    "groups": sorted(overlap) if overlap else [],
-                }
-            )
+    # Bounded heap instead of sorting every hit; ties keep walk order.
+    return [
+        {
+            "name": comp["name"],
+            "path": comp["rel_path"],
+            "score": score,
+            "groups": sorted(overlap),
+        }
+        for score, comp, overlap in heapq.nlargest(5, hits(), key=lambda h: h[0])
+    ]
 
-    scored.sort(key=lambda m: m["score"], reverse=True)
-    return scored[:5]
+
+def read_stdin() -> str | None:
+    """Read the hook payload, or None if it exceeds MAX_STDIN_BYTES."""
+    raw = sys.stdin.buffer.read(MAX_STDIN_BYTES)
+    if len(raw) == MAX_STDIN_BYTES and sys.stdin.buffer.read(1):
+        return None
+    return raw.decode("utf-8", errors="replace")
 
 
 # ---------------------------------------------------------------------------
@@ -241,8 +431,12 @@ def find_similar(
 
 def main() -> None:
     # ---- parse stdin --------------------------------------------------------
+    raw = read_stdin()
+    if raw is None:
+        _allow()
+        return
     try:
-        data = json.loads(sys.stdin.read())
+        data = json.loads(raw)
         file_path: str = data.get("path", "")
     except (json.JSONDecodeError, KeyError):
         _allow()
@@ -276,7 +470,7 @@ def main() -> None:
     if basename in ("index.ts", "index.tsx", "index.js", "index.jsx"):
         _allow()
         return
-    if re.search(r"\.(test|spec)\.", basename):
+    if _TEST_SPEC_RE.search(basename):
         _allow()
         return
 
@@ -312,13 +506,24 @@ def main() -> None:
             f"cannot serve this purpose."
         ),
     }
-    print(json.dumps(response))
-    sys.exit(0)
+    _respond(response)
+
+
+# The default response never changes – emit pre-encoded bytes instead of
+# running the JSON encoder on the most common path.
+_ALLOW_BYTES = b'{"continue": true}\n'
 
 
 def _allow() -> None:
     """Emit the default 'continue' response and exit."""
-    print(json.dumps({"continue": True}))
+    sys.stdout.buffer.write(_ALLOW_BYTES)
+    sys.exit(0)
+
+
+def _respond(response: dict) -> None:
+    """Emit *response* as one JSON line (single write + flush) and exit."""
+    sys.stdout.write(json.dumps(response) + "\n")
+    sys.stdout.flush()
     sys.exit(0)
 
 
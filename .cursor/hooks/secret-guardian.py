@@ -14,10 +14,16 @@ import sys
 
 # ---------------------------------------------------------------------------
 # Regex patterns for secrets we want to catch
+#
+# Every value class is bounded and is followed either by nothing or by a
+# delimiter it cannot match ("." after a JWT segment), so a failed attempt
+# backtracks at most once across its own run — no nested ambiguity, and no
+# need for atomic-group emulation.  Trailing bounds only cap how far a
+# match extends; longer values still match on their prefix.
 # ---------------------------------------------------------------------------
 SECRET_PATTERNS: dict[str, re.Pattern] = {
     "Stripe Secret Key": re.compile(
-        r"sk_(live|test)_[0-9a-zA-Z]{10,}"
+        r"sk_(live|test)_[0-9a-zA-Z]{10,128}"
     ),
     "Supabase Service Role Key": re.compile(
         # Supabase service-role keys are HS256 JWTs whose header is always
@@ -25,41 +31,80 @@ SECRET_PATTERNS: dict[str, re.Pattern] = {
         # {"alg":"HS256","typ":"JWT"}).  We require a long payload to
         # distinguish real keys from short test stubs.
         r"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
-        r"\.[A-Za-z0-9_\-]{100,}"
-        r"\.[A-Za-z0-9_\-]{20,}"
+        r"\.[A-Za-z0-9_\-]{100,2048}"
+        r"\.[A-Za-z0-9_\-]{20,256}"
     ),
     "QBO Refresh Token": re.compile(
         # Intuit / QuickBooks Online OAuth 2 refresh tokens — typically
         # prefixed with AB11 and followed by a long alphanumeric string.
         # Also catch generic "refresh_token" assignments with long values.
         r"(?:"
-        r"AB11[A-Za-z0-9]{20,}"            # Intuit-specific prefix
+        r"AB11[A-Za-z0-9]{20,256}"         # Intuit-specific prefix
         r"|"
         r"refresh_token\s*[=:]\s*[\"']?"    # key = "value" style
-        r"[A-Za-z0-9_\-]{30,}"
+        r"[A-Za-z0-9_\-]{30,256}"
         r")"
     ),
 }
 
+# Hook payloads are small JSON documents; anything larger is not buffered
+# or scanned — this hook fails closed and blocks it instead.
+MAX_STDIN_BYTES = 4 * 1024 * 1024
+
+
+# Literals at least one of which must appear for the matching pattern to
+# hit.  A plain substring probe is far cheaper than running the regex, so
+# patterns whose literals are absent are skipped entirely.  Keep in sync
+# with SECRET_PATTERNS.
+SECRET_LITERALS: dict[str, tuple[str, ...]] = {
+    "Stripe Secret Key": ("sk_live_", "sk_test_"),
+    "Supabase Service Role Key": ("eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.",),
+    "QBO Refresh Token": ("AB11", "refresh_token"),
+}
+
 
 def scan_for_secrets(text: str) -> list[str]:
     """Return names of every secret pattern that matches *text*."""
     return [
         name
         for name, pattern in SECRET_PATTERNS.items()
-        if pattern.search(text)
+        if any(literal in text for literal in SECRET_LITERALS[name])
+        and pattern.search(text)
     ]
 
 
+def read_stdin() -> str | None:
+    """Read the hook payload, or None if it exceeds MAX_STDIN_BYTES."""
+    raw = sys.stdin.buffer.read(MAX_STDIN_BYTES)
+    if len(raw) == MAX_STDIN_BYTES and sys.stdin.buffer.read(1):
+        return None
+    return raw.decode("utf-8", errors="replace")
+
+
 def main() -> None:
-    raw_input = sys.stdin.read()
+    raw_input = read_stdin()
+    if raw_input is None:
+        # Too large to scan in full — block rather than let a secret past
+        # the size cap.
+        _respond({
+            "continue": False,
+            "user_message": (
+                "Action blocked: input exceeds the "
+                f"{MAX_STDIN_BYTES // (1024 * 1024)} MB secret-scan limit."
+            ),
+            "agent_message": json.dumps({
+                "status": "blocked",
+                "reason": "Input too large to scan for secrets.",
+            }),
+        })
+        return
 
     try:
         data: dict = json.loads(raw_input)
     except (json.JSONDecodeError, TypeError):
         # Unparseable input — allow through so we don't break the IDE
-        print(json.dumps({"continue": True}))
-        sys.exit(0)
+        _allow()
+        return
 
     # Collect every string field the hook might receive depending on
     # whether this is a beforeSubmitPrompt or beforeShellExecution call.
@@ -72,34 +117,50 @@ def main() -> None:
     text_to_scan = " ".join(text_parts) if text_parts else raw_input
 
     detected = scan_for_secrets(text_to_scan)
+    if not detected:
+        _allow()
+        return
 
-    if detected:
-        secret_types = ", ".join(detected)
-        response = {
-            "continue": False,
-            "user_message": (
-                f"Action blocked: potential secret detected ({secret_types}). "
+    secret_types = ", ".join(detected)
+    response = {
+        "continue": False,
+        "user_message": (
+            f"Action blocked: potential secret detected ({secret_types}). "
+            "Use environment variables instead."
+        ),
+        "agent_message": json.dumps({
+            "status": "blocked",
+            "reason": (
+                "Action blocked: Potential secret detected. "
                 "Use environment variables instead."
             ),
-            "agent_message": json.dumps({
-                "status": "blocked",
-                "reason": (
-                    "Action blocked: Potential secret detected. "
-                    "Use environment variables instead."
-                ),
-                "detected_types": detected,
-                "recommendation": (
-                    "Reference secrets via environment variables "
-                    "(e.g. process.env.STRIPE_SECRET_KEY, "
-                    "import.meta.env.VITE_SUPABASE_ANON_KEY) "
-                    "rather than hardcoding values."
-                ),
-            }),
-        }
-    else:
-        response = {"continue": True}
+            "detected_types": detected,
+            "recommendation": (
+                "Reference secrets via environment variables "
+                "(e.g. process.env.STRIPE_SECRET_KEY, "
+                "import.meta.env.VITE_SUPABASE_ANON_KEY) "
+                "rather than hardcoding values."
+            ),
+        }),
+    }
+    _respond(response)
+
+
+# The default response never changes – emit pre-encoded bytes instead of
+# running the JSON encoder on the most common path.
+_ALLOW_BYTES = b'{"continue": true}\n'
+
+
+def _allow() -> None:
+    """Emit the default 'continue' response and exit."""
+    sys.stdout.buffer.write(_ALLOW_BYTES)
+    sys.exit(0)
+
 
-    print(json.dumps(response))
+def _respond(response: dict) -> None:
+    """Emit *response* as one JSON line (single write + flush) and exit."""
+    sys.stdout.write(json.dumps(response) + "\n")
+    sys.stdout.flush()
     sys.exit(0)
 
 